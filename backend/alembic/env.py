@@ -22,15 +22,23 @@ from database import Base
 # IMPORTANT: import all models so Alembic can detect tables
 from models.payment_model import Payment
 from models.order_model import Order
-# Later you can add:
-# from models.product_model import Product
-# from models.cart_model import Cart
-# from models.inventory_model import Inventory
+from models.user_model import User
+from models.product_model import Product, Category
+from models.cart_model import Cart
+from models.inventory_model import Inventory
 
 # Set metadata for autogenerate support
 target_metadata = Base.metadata
 
 
+def include_name(name, type_, parent_names):
+    # The products_fts FTS5 table (and its shadow tables) is managed by raw
+    # DDL, not metadata; keep autogenerate from proposing to drop it.
+    if type_ == "table" and name and name.startswith("products_fts"):
+        return False
+    return True
+
+
 # --------------------------------------------------
 # OFFLINE MIGRATIONS
 # --------------------------------------------------
@@ -47,6 +55,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         render_as_batch=True,  # REQUIRED FOR SQLITE
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -72,6 +81,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             render_as_batch=True,  # REQUIRED FOR SQLITE
+            include_name=include_name,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,42 @@
+"""add hot path indexes
+
+Revision ID: 5c1d7e9a2b34
+Revises: 0f42c49b8308
+Create Date: 2026-10-15 10:12:41.208113
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1d7e9a2b34"
+down_revision: Union[str, Sequence[str], None] = "0f42c49b8308"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_products_category_price",
+        "products",
+        ["category_id", "price"],
+    )
+    op.create_index("ix_products_status", "products", ["status"])
+    op.create_index(
+        "ix_orders_user_created",
+        "orders",
+        ["user_id", "created_at"],
+    )
+    op.create_index("ix_payments_order_id", "payments", ["order_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_payments_order_id", table_name="payments")
+    op.drop_index("ix_orders_user_created", table_name="orders")
+    op.drop_index("ix_products_status", table_name="products")
+    op.drop_index("ix_products_category_price", table_name="products")
@@ -0,0 +1,28 @@
+"""add orders created_at/id index
+
+Revision ID: 8e3f1a6c4d27
+Revises: 5c1d7e9a2b34
+Create Date: 2026-10-15 17:30:02.514327
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e3f1a6c4d27"
+down_revision: Union[str, Sequence[str], None] = "5c1d7e9a2b34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_orders_created_id", "orders", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_orders_created_id", table_name="orders")
@@ -0,0 +1,40 @@
+"""cart_items.unit_price float -> numeric
+
+Revision ID: d41a9c2e7b08
+Revises: b7d2c4e9f150
+Create Date: 2026-10-15 17:33:47.105268
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d41a9c2e7b08"
+down_revision: Union[str, Sequence[str], None] = "b7d2c4e9f150"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("cart_items", schema=None) as batch_op:
+        batch_op.alter_column(
+            "unit_price",
+            existing_type=sa.Float(),
+            type_=sa.Numeric(precision=10, scale=2),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("cart_items", schema=None) as batch_op:
+        batch_op.alter_column(
+            "unit_price",
+            existing_type=sa.Numeric(precision=10, scale=2),
+            type_=sa.Float(),
+            existing_nullable=False,
+        )
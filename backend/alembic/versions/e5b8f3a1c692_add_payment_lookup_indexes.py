@@ -0,0 +1,43 @@
+"""add payment lookup indexes
+
+Revision ID: e5b8f3a1c692
+Revises: d41a9c2e7b08
+Create Date: 2026-10-15 17:52:41.308114
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b8f3a1c692"
+down_revision: Union[str, Sequence[str], None] = "d41a9c2e7b08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_payments_pending_lookup",
+        "payments",
+        ["order_id", "user_id"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+        sqlite_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index(
+        "ix_payments_order_user_rpid",
+        "payments",
+        ["order_id", "user_id", "razorpay_order_id"],
+    )
+    # Leading column of ix_payments_order_user_rpid
+    op.drop_index("ix_payments_order_id", table_name="payments")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_payments_order_id", "payments", ["order_id"])
+    op.drop_index("ix_payments_order_user_rpid", table_name="payments")
+    op.drop_index("ix_payments_pending_lookup", table_name="payments")
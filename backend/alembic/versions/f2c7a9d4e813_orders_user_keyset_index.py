@@ -0,0 +1,33 @@
+"""orders user_id/created_at/id keyset index
+
+Revision ID: f2c7a9d4e813
+Revises: e5b8f3a1c692
+Create Date: 2026-10-15 18:06:19.842571
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7a9d4e813"
+down_revision: Union[str, Sequence[str], None] = "e5b8f3a1c692"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Supersedes ix_orders_user_created: same prefix plus the id tiebreaker
+    op.create_index(
+        "ix_orders_user_created_id", "orders", ["user_id", "created_at", "id"]
+    )
+    op.drop_index("ix_orders_user_created", table_name="orders")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_orders_user_created", "orders", ["user_id", "created_at"])
+    op.drop_index("ix_orders_user_created_id", table_name="orders")
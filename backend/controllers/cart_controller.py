@@ -1,28 +1,59 @@
 # Controllers/cart_controller.py
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
 from database import get_db
 from models.user_model import User
-from schemas.cart_schema import CartRead, CartItemCreate, CartItemUpdate
+from schemas.cart_schema import CartItemCreate, CartItemsBulkCreate, CartItemUpdate
 from services.cart_services import CartService
 from controllers.user_controller import get_current_user  # reuse your auth
 from utils.response_helper import success_response
+from utils.cache import cache_get, cache_set, cache_delete
 
 router = APIRouter(prefix="/cart", tags=["Cart"])
 
+CART_CACHE_TTL = 300  # seconds
+
+
+def _cart_key(user_id: int) -> str:
+    return f"cart:{user_id}"
+
+
+def invalidate_cart_cache(user_id: int) -> None:
+    # Call after anything that changes the user's cart (incl. placing an order)
+    cache_delete(_cart_key(user_id))
+
 
 @router.get("/")
 def get_cart(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    cached = cache_get(_cart_key(current_user.id))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = CartService(db)
     cart = service.get_cart_for_user(current_user.id)
-    return success_response(
+    response = success_response(
         message="Cart retrieved successfully",
-        data=cart.model_dump()
+        data=cart
+    )
+    cache_set(_cart_key(current_user.id), response.body, CART_CACHE_TTL)
+    return response
+
+
+@router.get("/summary")
+def get_cart_summary(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    service = CartService(db)
+    summary = service.get_cart_summary(current_user.id)
+    return success_response(
+        message="Cart summary retrieved successfully",
+        data=summary
     )
 
 
@@ -34,9 +65,26 @@ def add_item_to_cart(
 ):
     service = CartService(db)
     cart = service.add_item(current_user.id, item)
+    invalidate_cart_cache(current_user.id)
     return success_response(
         message="Item added to cart successfully",
-        data=cart.model_dump(),
+        data=cart,
+        status_code=201
+    )
+
+
+@router.post("/items/bulk")
+def add_items_to_cart(
+    body: CartItemsBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    service = CartService(db)
+    cart = service.add_items(current_user.id, body)
+    invalidate_cart_cache(current_user.id)
+    return success_response(
+        message="Items added to cart successfully",
+        data=cart,
         status_code=201
     )
 
@@ -50,9 +98,10 @@ def update_cart_item(
 ):
     service = CartService(db)
     cart = service.update_item_quantity(current_user.id, item_id, item_update)
+    invalidate_cart_cache(current_user.id)
     return success_response(
         message="Cart item updated successfully",
-        data=cart.model_dump()
+        data=cart
     )
 
 
@@ -64,6 +113,7 @@ def remove_cart_item(
 ):
     service = CartService(db)
     service.remove_item(current_user.id, item_id)
+    invalidate_cart_cache(current_user.id)
     return success_response(
         message="Item removed from cart successfully",
         data=None,
@@ -78,6 +128,7 @@ def clear_cart(
 ):
     service = CartService(db)
     service.clear_cart(current_user.id)
+    invalidate_cart_cache(current_user.id)
     return success_response(
         message="Cart cleared successfully",
         data=None,
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, get_read_db
 from schemas.inventory_schema import (
     InventoryCreate,
     InventoryUpdate,
     InventoryResponse,
 )
-from services.inventory_services import create_inventory_for_product
+from services.inventory_services import create_inventory_for_product, update_inventory_stock
 from repositories.inventory_repository import get_by_product_id
 from utils.jwt_utils import get_current_user
 from utils.response_helper import success_response
@@ -42,7 +42,7 @@ def create_inventory(
 @router.get("/{product_id}")
 def get_inventory(
     product_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user=Depends(get_current_user),
 ):
     inventory = get_by_product_id(db, product_id)
@@ -67,19 +67,12 @@ def update_inventory(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    inventory = get_by_product_id(db, product_id)
+    # Adjusts available stock by the same delta, atomically
+    inventory = update_inventory_stock(db, product_id, data.total_stock)
 
     if not inventory:
         raise HTTPException(status_code=404, detail="Inventory not found")
 
-    # Adjust available stock correctly
-    diff = data.total_stock - inventory.total_stock
-    inventory.total_stock = data.total_stock
-    inventory.available_stock += diff
-
-    db.commit()
-    db.refresh(inventory)
-
     return success_response(
         message="Inventory updated successfully",
         data=InventoryResponse.model_validate(
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from models.user_model import User
-from schemas.order_schema import OrderCreate
+from schemas.user_schema import UserRead
+from schemas.order_schema import OrderCreate, OrderRead
 
 from utils.mappers.order_mapper import (
     map_order_list,
@@ -10,13 +16,19 @@ from utils.mappers.order_mapper import (
 )
 
 from services.order_services import OrderService
-from controllers.user_controller import get_current_user
-from utils.response_helper import success_response
-from database import get_db
+from repositories.order_repository import OrderRepository
+from controllers.user_controller import get_current_user, require_roles
+from controllers.cart_controller import invalidate_cart_cache
+from utils.response_helper import _orjson_default, success_response
+from database import get_db, get_read_db
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
+def get_order_repo(db: Session = Depends(get_read_db)) -> OrderRepository:
+    return OrderRepository(db)
+
+
 # ================= CREATE ORDER =================
 @router.post("/", status_code=status.HTTP_201_CREATED)
 def create_order_from_cart(
@@ -31,6 +43,8 @@ def create_order_from_cart(
         shipping_address=body.shipping_address,
         payment_method=body.payment_method,
     )
+    # Placing an order empties the cart
+    invalidate_cart_cache(current_user.id)
 
     return success_response(
         message="Order created successfully",
@@ -42,24 +56,70 @@ def create_order_from_cart(
 # ================= LIST MY ORDERS =================
 @router.get("/")
 def list_my_orders(
-    db: Session = Depends(get_db),
+    before_created_at: Optional[datetime] = Query(None),
+    before_id: Optional[int] = Query(None, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     service = OrderService(db)
 
-    orders = service.list_user_orders(current_user.id)
+    cursor = (
+        (before_created_at, before_id)
+        if before_created_at is not None and before_id is not None
+        else None
+    )
+    orders = service.list_user_orders(current_user.id, cursor=cursor, limit=limit)
+    summary = service.get_user_orders_summary(current_user.id)
+
+    next_cursor = None
+    if len(orders) == limit:
+        last = orders[-1]
+        next_cursor = {"before_created_at": last.created_at, "before_id": last.id}
 
     return success_response(
         message="Orders retrieved successfully",
-        data=map_order_list(orders)     # ✅ FIXED
+        data=map_order_list(orders, summary),
+        meta={"next_cursor": next_cursor},
     )
 
 
+# ================= EXPORT ORDERS (ADMIN) =================
+@router.get("/export")
+def export_orders(
+    order_status: Optional[str] = Query(None, alias="status"),
+    user_id: Optional[int] = None,
+    min_date: Optional[datetime] = None,
+    max_date: Optional[datetime] = None,
+    repo: OrderRepository = Depends(get_order_repo),
+    current_user: UserRead = Depends(require_roles("admin")),
+):
+    filters = {
+        key: value
+        for key, value in {
+            "status": order_status,
+            "user_id": user_id,
+            "min_date": min_date,
+            "max_date": max_date,
+        }.items()
+        if value is not None
+    }
+
+    # One JSON document per line, written as rows stream off the cursor.
+    # Encoded like APIResponse so money fields match the other endpoints.
+    def ndjson():
+        for order in repo.iter_orders(filters):
+            payload = OrderRead.model_validate(order).model_dump()
+            yield orjson.dumps(payload, default=_orjson_default) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 # ================= GET SINGLE ORDER =================
 @router.get("/{order_id}")
 def get_my_order(
     order_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     service = OrderService(db)
@@ -78,14 +138,8 @@ def update_order_status(
     order_id: int,
     new_status: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserRead = Depends(require_roles("admin")),
 ):
-    if current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
     service = OrderService(db)
     order = service.update_status(order_id, new_status)
 
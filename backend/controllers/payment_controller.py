@@ -2,22 +2,26 @@
 
 from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import Session
 
 from services.payment_services import PaymentService
 from schemas.payment_schema import (
     PaymentSessionCreate,
-    PaymentSessionResponse,
     PaymentVerifyRequest,
     PaymentRead,
 )
 from utils.jwt_utils import decode_access_token  # or your security.py
 from schemas.user_schema import TokenData
 from utils.response_helper import success_response
+from database import get_db
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login")  # adjust if different
-service = PaymentService()
+
+
+def get_payment_service(db: Session = Depends(get_db)) -> PaymentService:
+    return PaymentService(db)
 
 
 def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
@@ -37,11 +41,12 @@ def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
 def create_payment_session(
     payload: PaymentSessionCreate,
     current_user_id: int = Depends(get_current_user_id),
+    service: PaymentService = Depends(get_payment_service),
 ):
     session = service.create_payment_session(current_user_id, payload)
     return success_response(
         message="Payment session created successfully",
-        data=session.model_dump(),
+        data=session,
         status_code=201
     )
 
@@ -50,9 +55,10 @@ def create_payment_session(
 def verify_payment(
     payload: PaymentVerifyRequest,
     current_user_id: int = Depends(get_current_user_id),
+    service: PaymentService = Depends(get_payment_service),
 ):
     payment = service.verify_and_capture_payment(current_user_id, payload)
     return success_response(
         message="Payment verified successfully",
-        data=PaymentRead.model_validate(payment).model_dump()
+        data=PaymentRead.model_validate(payment)
     )
@@ -1,18 +1,20 @@
 # Controllers/product_controller.py
 
-from typing import List, Optional
+import hashlib
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, status, Query, Response
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, get_read_db
 from services.product_services import ProductService
-from schemas.product_schema import ProductCreate, ProductUpdate, ProductRead
+from schemas.product_schema import ProductCreate, ProductUpdate, PRODUCT_LIST_ADAPTER
 from schemas.user_schema import UserRead
 from utils.response_helper import success_response
+from utils.cache import cache_get, cache_set, cache_delete, cache_incr
 
-# Reuse your existing auth dependency
-from controllers.user_controller import get_current_user  # adjust import if needed
+# Reuse the shared role-check dependency
+from controllers.user_controller import require_roles
 
 router = APIRouter(
     prefix="/products",
@@ -20,31 +22,55 @@ router = APIRouter(
 )
 
 
+PRODUCT_CACHE_TTL = 600       # seconds
+PRODUCT_LIST_CACHE_TTL = 60   # seconds
+
+
+# ----- helper: cache keys -----
+
+def _product_key(product_id: int) -> str:
+    return f"products:{product_id}"
+
+
+# List keys embed a version number; bumping it orphans every cached page
+# at once (they age out via TTL) instead of SCANning for them.
+PRODUCT_LIST_VERSION_KEY = "products:list:version"
+
+
+def _product_list_key(*params) -> str:
+    version = cache_get(PRODUCT_LIST_VERSION_KEY) or "0"
+    digest = hashlib.blake2b(repr(params).encode(), digest_size=16).hexdigest()
+    return f"products:list:v{version}:{digest}"
+
+
+def _invalidate_product_cache(product_id: int) -> None:
+    cache_delete(_product_key(product_id))
+    cache_incr(PRODUCT_LIST_VERSION_KEY)
+
+
 # ----- helper: admin check -----
 
-def get_current_admin_user(
-    current_user: UserRead = Depends(get_current_user),
-) -> UserRead:
-    if current_user.role not in ("admin", "staff"):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-    return current_user
+get_current_admin_user = require_roles("admin", "staff")
 
 
 # ----- Public / user-facing endpoints -----
 
 @router.get("/")
 def list_products(
-    skip: int = Query(0, ge=0),
+    skip: int = Query(0, ge=0, deprecated=True),
+    after_id: Optional[int] = Query(None, ge=0),
     limit: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
     category_id: Optional[int] = Query(None),
     min_price: Optional[float] = Query(None, ge=0),
     max_price: Optional[float] = Query(None, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
+    cache_key = _product_list_key(skip, after_id, limit, search, category_id, min_price, max_price)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = ProductService(db)
     products = service.list_products(
         skip=skip,
@@ -53,24 +79,35 @@ def list_products(
         category_id=category_id,
         min_price=min_price,
         max_price=max_price,
+        after_id=after_id,
     )
-    return success_response(
+    next_cursor = products[-1].id if len(products) == limit else None
+    response = success_response(
         message="Products retrieved successfully",
-        data=[ProductRead.model_validate(p).model_dump() for p in products]
+        data=PRODUCT_LIST_ADAPTER.dump_python(products),
+        meta={"next_cursor": next_cursor},
     )
+    cache_set(cache_key, response.body, PRODUCT_LIST_CACHE_TTL)
+    return response
 
 
 @router.get("/{product_id}")
 def get_product(
     product_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
+    cached = cache_get(_product_key(product_id))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = ProductService(db)
     product = service.get_product(product_id)
-    return success_response(
+    response = success_response(
         message="Product retrieved successfully",
-        data=product.model_dump()
+        data=product
     )
+    cache_set(_product_key(product_id), response.body, PRODUCT_CACHE_TTL)
+    return response
 
 
 # ----- Admin endpoints (protected) -----
@@ -83,9 +120,10 @@ def create_product(
 ):
     service = ProductService(db)
     product = service.create_product(product_in)
+    _invalidate_product_cache(product.id)
     return success_response(
         message="Product created successfully",
-        data=product.model_dump(),
+        data=product,
         status_code=201
     )
 
@@ -99,9 +137,10 @@ def update_product(
 ):
     service = ProductService(db)
     product = service.update_product(product_id, product_in)
+    _invalidate_product_cache(product_id)
     return success_response(
         message="Product updated successfully",
-        data=product.model_dump()
+        data=product
     )
 
 
@@ -113,6 +152,7 @@ def delete_product(
 ):
     service = ProductService(db)
     service.delete_product(product_id)
+    _invalidate_product_cache(product_id)
     return success_response(
         message="Product deleted successfully",
         data=None,
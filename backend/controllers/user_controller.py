@@ -1,15 +1,18 @@
 # user_controller.py  (or app/api/v1/users.py)
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from database import get_db
-from schemas.user_schema import UserCreate, UserRead, UserLogin, Token
+from database import get_db, get_read_db
+from schemas.user_schema import UserCreate, UserRead, UserLogin
 from services.user_services import UserService
-from utils.jwt_utils import decode_access_token
+from utils.jwt_utils import cache_user, decode_access_token, get_cached_user, invalidate_user_cache
 from utils.response_helper import success_response
-from utils.request_context import get_current_user ,set_current_user
+from utils.request_context import get_request_user, set_request_user
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -21,26 +24,67 @@ def get_user_service(db: Session = Depends(get_db)) -> UserService:
     return UserService(db)
 
 
+def get_read_user_service(db: Session = Depends(get_read_db)) -> UserService:
+    return UserService(db)
+
+
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
 ) -> UserRead:
+    # Resolved once per request, whichever auth dependency got there first
+    user_read = get_request_user(request)
+    if user_read is not None:
+        return user_read
+
+    # Signature check is memoized per token; expiry is re-checked every call
     token_data = decode_access_token(token)
     if token_data is None or token_data.email is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
-
-    service = UserService(db)
-    user = service.repo.get_by_email(token_data.email)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-    set_current_user(user) 
-    return UserRead.from_orm(user)
+    email = token_data.email
+
+    # Same two-level cache as jwt_utils.get_current_user, then the DB
+    user_read = get_cached_user(email)
+    if user_read is None:
+        service = UserService(db)
+        # Sync DB call inside an async dependency: run it in the threadpool
+        # so it doesn't block the event loop for every in-flight request.
+        user = await run_in_threadpool(service.repo.get_by_email, email)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        user_read = UserRead.model_validate(user)
+        cache_user(user_read)
+
+    set_request_user(request, user_read)
+    return user_read
+
+
+def require_roles(*roles: str):
+    """
+    Dependency factory for role-based access, e.g.
+    Depends(require_roles("admin", "staff")).
+    Reuses the UserRead resolved by get_current_user (no extra lookup).
+    """
+    allowed = frozenset(roles)
+
+    def _require_roles(
+        current_user: UserRead = Depends(get_current_user),
+    ) -> UserRead:
+        if current_user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not enough permissions",
+            )
+        return current_user
+
+    return _require_roles
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
@@ -49,9 +93,10 @@ def register_user(
     service: UserService = Depends(get_user_service),
 ):
     user = service.register_user(user_in)
+    invalidate_user_cache(user.email)
     return success_response(
         message="User registered successfully",
-        data=user.model_dump(),
+        data=user,
         status_code=201
     )
 
@@ -72,19 +117,22 @@ def login(
 def read_me(current_user: UserRead = Depends(get_current_user)):
     return success_response(
         message="Current user profile retrieved successfully",
-        data=current_user.model_dump()
+        data=current_user
     )
 
 
 @router.get("/")
 def list_users(
-    skip: int = 0,
-    limit: int = 100,
-    service: UserService = Depends(get_user_service),
+    skip: int = Query(0, ge=0, deprecated=True),
+    after_id: Optional[int] = Query(None, ge=0),
+    limit: int = Query(100, ge=1),
+    service: UserService = Depends(get_read_user_service),
     current_user: UserRead = Depends(get_current_user),  # protect if you want
 ):
-    users = service.list_users(skip=skip, limit=limit)
+    users = service.list_users(skip=skip, limit=limit, after_id=after_id)
+    next_cursor = users[-1].id if len(users) == limit else None
     return success_response(
         message="Users retrieved successfully",
-        data=[user.model_dump() for user in users]
+        data=users,
+        meta={"next_cursor": next_cursor},
     )
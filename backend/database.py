@@ -1,20 +1,134 @@
 # database.py
 
-from sqlalchemy import create_engine
+import os
+
+from dotenv import load_dotenv
+from fastapi import Request
+from sqlalchemy import create_engine, event, make_url, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+load_dotenv()
+
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"  # change to your DB
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+# Read replica for GET endpoints. Defaults to the primary, in which case
+# reads simply share the primary engine and request session.
+SQLALCHEMY_READ_DATABASE_URL = os.getenv("READ_DATABASE_URL", SQLALCHEMY_DATABASE_URL)
+
+# Dev convenience: create missing tables on startup.
+# Set AUTO_CREATE_TABLES=false where Alembic owns the schema.
+AUTO_CREATE_TABLES = os.getenv("AUTO_CREATE_TABLES", "true").lower() in ("1", "true", "yes")
+
+# Arbitrary app-wide key for the Postgres advisory lock guarding startup DDL
+SCHEMA_LOCK_KEY = 720431
+
+# Per-process connection pool (each worker gets its own)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+
+
+def _make_engine(url: str):
+    # sqlite3-only options; psycopg2 and friends reject unknown DSN keys
+    connect_args = (
+        {"check_same_thread": False, "timeout": 30}
+        if make_url(url).get_backend_name() == "sqlite"
+        else {}
+    )
+    return create_engine(
+        url,
+        connect_args=connect_args,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        # Reuse the most recently returned (warm) connection; idle overflow
+        # connections sink to the bottom and get closed after a burst.
+        pool_use_lifo=True,
+    )
+
+
+engine = _make_engine(SQLALCHEMY_DATABASE_URL)
+read_engine = (
+    engine
+    if SQLALCHEMY_READ_DATABASE_URL == SQLALCHEMY_DATABASE_URL
+    else _make_engine(SQLALCHEMY_READ_DATABASE_URL)
+)
+
+# SQLite tuning: WAL lets readers run alongside the single writer and
+# busy_timeout waits for the write lock instead of failing with SQLITE_BUSY.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA mmap_size=134217728",
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+for _engine in {engine, read_engine}:
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
+
+
+# expire_on_commit=False: objects stay loaded after commit, so returning what
+# a service just wrote doesn't cost a refresh SELECT. Anything changed behind
+# the ORM's back (Core UPDATE/DELETE) must be re-queried, not read from memory.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine)
 
 Base = declarative_base()
 
 
-def get_db():
+def create_tables() -> None:
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Multi-worker deploys: one worker runs the DDL, the rest wait
+            # for the lock and then find the tables already there.
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        Base.metadata.create_all(bind=conn)
+
+        from models.product_model import ensure_product_fts  # models import Base from here
+        ensure_product_fts(conn)
+
+
+def get_db(request: Request):
+    # One session per request, also exposed on request.state so helpers
+    # outside the dependency graph reuse it instead of opening their own.
+    db = getattr(request.state, "db", None)
+    if db is not None:
+        yield db
+        return
+
     db = SessionLocal()
+    request.state.db = db
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(request: Request):
+    # Read-only endpoints. Replica lag means a GET may briefly miss a write
+    # made just before it, so keep read-your-writes paths on get_db.
+    if read_engine is engine:
+        yield from get_db(request)
+        return
+
+    db = getattr(request.state, "read_db", None)
+    if db is not None:
+        yield db
+        return
+
+    db = ReadSessionLocal()
+    request.state.read_db = db
     try:
         yield db
     finally:
@@ -1,7 +1,12 @@
 # main.py
 
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
-from database import Base, engine
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from database import AUTO_CREATE_TABLES, DB_MAX_OVERFLOW, DB_POOL_SIZE, create_tables
 from models.product_model import  Product, Category
 from models.user_model import User  # just importing so tables are registered
 from controllers.user_controller import router as user_router
@@ -20,9 +25,22 @@ from utils.exception_handler import (
     generic_exception_handler,
 )
 
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync handlers and dependencies run in anyio's threadpool (40 threads by
+    # default). Match it to the DB pool so concurrent DB-bound requests
+    # aren't capped below the number of available connections.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, DB_POOL_SIZE + DB_MAX_OVERFLOW)
+
+    # Schema creation runs once per worker at startup, not at import time
+    if AUTO_CREATE_TABLES:
+        await run_in_threadpool(create_tables)
+    yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 app.add_middleware(
@@ -1,7 +1,7 @@
 # models/cart_model.py
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, Numeric, DateTime, Boolean
 from sqlalchemy.orm import relationship
 
 from database import Base
@@ -27,7 +27,7 @@ class CartItem(Base):
     cart_id = Column(Integer, ForeignKey("carts.id"), nullable=False, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
     quantity = Column(Integer, nullable=False)
-    unit_price = Column(Float, nullable=False)  # price snapshot
+    unit_price = Column(Numeric(10, 2), nullable=False)  # price snapshot
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
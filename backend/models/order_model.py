@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     Numeric,
     DateTime,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -48,6 +49,14 @@ class Order(Base):
     )
     payments = relationship("Payment", back_populates="order")
 
+    __table_args__ = (
+        # list_user_orders keyset: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+        # (scanned backwards, so ascending columns serve the DESC order)
+        Index("ix_orders_user_created_id", "user_id", "created_at", "id"),
+        # Admin list_orders keyset: ORDER BY created_at DESC, id DESC
+        Index("ix_orders_created_id", "created_at", "id"),
+    )
+
 
 class OrderItem(Base):
     __tablename__ = "order_items"
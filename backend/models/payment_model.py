@@ -6,6 +6,8 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     UniqueConstraint,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -47,6 +49,18 @@ class Payment(Base):
             "razorpay_payment_id",
             name="uq_order_payment_idempotent",
         ),
+        # create_payment_session: reuse the PENDING session of (order, user).
+        # Partial, so only open sessions are indexed.
+        Index(
+            "ix_payments_pending_lookup",
+            "order_id",
+            "user_id",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+        # verify_and_capture_payment: WHERE order_id, user_id, razorpay_order_id.
+        # Also serves plain order_id lookups, so no separate order_id index.
+        Index("ix_payments_order_user_rpid", "order_id", "user_id", "razorpay_order_id"),
     )
 
     order = relationship("Order", back_populates="payments")
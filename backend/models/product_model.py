@@ -1,7 +1,8 @@
 # models.py
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Numeric, Index, DDL, event
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import column, table
 from database import Base
 
 # --- existing User model stays as it is ---
@@ -31,3 +32,59 @@ class Product(Base):
 
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
     category = relationship("Category", back_populates="products")
+
+    __table_args__ = (
+        # list_products filters by category + price range and always by status
+        Index("ix_products_category_price", "category_id", "price"),
+        Index("ix_products_status", "status"),
+    )
+
+
+# --- SQLite full-text search over name/description ---
+# External-content FTS5 table kept in sync by triggers. The trigram tokenizer
+# keeps substring semantics (same results as ILIKE '%q%') for queries of 3+
+# chars. Other backends, and shorter queries, fall back to ILIKE.
+# Note: Alembic batch ops that recreate `products` drop these triggers.
+
+PRODUCT_FTS_TABLE = "products_fts"
+
+PRODUCT_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {PRODUCT_FTS_TABLE} USING fts5("
+    "name, description, content='products', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN "
+    f"INSERT INTO {PRODUCT_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN "
+    f"INSERT INTO {PRODUCT_FTS_TABLE}({PRODUCT_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, description ON products BEGIN "
+    f"INSERT INTO {PRODUCT_FTS_TABLE}({PRODUCT_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f"INSERT INTO {PRODUCT_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+)
+
+for _stmt in PRODUCT_FTS_DDL:
+    event.listen(Product.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+
+
+def ensure_product_fts(conn) -> None:
+    """Create the FTS table/triggers on a SQLite DB that predates them.
+
+    create_all() only fires after_create for tables it creates, so an
+    existing products table never gets them that way.
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    exists = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (PRODUCT_FTS_TABLE,)
+    ).first()
+    for stmt in PRODUCT_FTS_DDL:
+        conn.exec_driver_sql(stmt)
+    if not exists:
+        # Index the rows that are already there
+        conn.exec_driver_sql(f"INSERT INTO {PRODUCT_FTS_TABLE}({PRODUCT_FTS_TABLE}) VALUES ('rebuild')")
+
+
+# Lightweight handle for querying the virtual table (not part of metadata)
+products_fts = table(PRODUCT_FTS_TABLE, column("rowid"), column(PRODUCT_FTS_TABLE))
@@ -1,6 +1,8 @@
 # Repositories/cart_repository.py
 
-from typing import Optional, List
+from decimal import Decimal
+from typing import Optional, List, Tuple
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from models.cart_model import Cart, CartItem
@@ -8,6 +10,8 @@ from models.product_model import Product
 
 
 class CartRepository:
+    # Write methods only flush; CartService commits once per operation.
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -22,10 +26,16 @@ class CartRepository:
     def create_cart_for_user(self, user_id: int) -> Cart:
         cart = Cart(user_id=user_id)
         self.db.add(cart)
-        self.db.commit()
-        self.db.refresh(cart)
+        self.db.flush()
         return cart
 
+    def cart_totals(self, cart_id: int) -> Decimal:
+        # SUM in the DB: summary callers never hydrate the CartItem rows
+        return self.db.execute(
+            select(func.coalesce(func.sum(CartItem.unit_price * CartItem.quantity), 0))
+            .where(CartItem.cart_id == cart_id)
+        ).scalar_one()
+
     # --- Cart items ---
     def get_item_by_id(self, item_id: int, cart_id: int) -> Optional[CartItem]:
         return (
@@ -34,49 +44,48 @@ class CartRepository:
             .first()
         )
 
-    def get_item_by_product(self, cart_id: int, product_id: int) -> Optional[CartItem]:
-        return (
-            self.db.query(CartItem)
-            .filter(
-                CartItem.cart_id == cart_id,
-                CartItem.product_id == product_id,
+    def add_items_bulk(self, cart: Cart, items: List[Tuple[Product, int]]) -> None:
+        """
+        Add many (product, quantity) pairs in one go: one SELECT for the
+        lines already in the cart and one flush for the new rows.
+        """
+        product_ids = [product.id for product, _ in items]
+        existing = {
+            item.product_id: item
+            for item in self.db.query(CartItem).filter(
+                CartItem.cart_id == cart.id,
+                CartItem.product_id.in_(product_ids),
             )
-            .first()
-        )
+        }
 
-    def add_item(self, cart: Cart, product: Product, quantity: int) -> CartItem:
-        item = self.get_item_by_product(cart.id, product.id)
-        if item:
-            item.quantity += quantity
-        else:
-            item = CartItem(
-                cart_id=cart.id,
-                product_id=product.id,
-                quantity=quantity,
-                unit_price=product.price,
-            )
-            self.db.add(item)
+        for product, quantity in items:
+            item = existing.get(product.id)
+            if item:
+                item.quantity += quantity
+            else:
+                self.db.add(
+                    CartItem(
+                        cart_id=cart.id,
+                        product_id=product.id,
+                        quantity=quantity,
+                        unit_price=product.price,
+                    )
+                )
 
-        self.db.commit()
-        self.db.refresh(item)
-        self.db.refresh(cart)
-        return item
+        self.db.flush()
 
     def update_item_quantity(self, item: CartItem, quantity: int) -> CartItem:
         item.quantity = quantity
-        self.db.commit()
-        self.db.refresh(item)
+        self.db.flush()
         return item
 
     def remove_item(self, item: CartItem) -> None:
         self.db.delete(item)
-        self.db.commit()
+        self.db.flush()
 
     def clear_cart(self, cart: Cart) -> None:
-        for item in list(cart.items):
-            self.db.delete(item)
-        self.db.commit()
+        self.db.execute(delete(CartItem).where(CartItem.cart_id == cart.id))
 
     # --- Helper ---
-    def get_product(self, product_id: int) -> Optional[Product]:
-        return self.db.query(Product).filter(Product.id == product_id).first()
+    def get_products_by_ids(self, product_ids: List[int]) -> List[Product]:
+        return self.db.query(Product).filter(Product.id.in_(product_ids)).all()
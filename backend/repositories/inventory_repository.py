@@ -1,14 +1,93 @@
+from typing import Dict, Iterable, List
+
+from sqlalchemy import case, select, update
 from sqlalchemy.orm import Session
 from models.inventory_model  import Inventory
+from models.order_model import OrderItem
 
 def get_by_product_id(db: Session, product_id: int):
     return db.query(Inventory).filter(Inventory.product_id == product_id).first()
 
+def lock_inventory_rows(db: Session, product_ids: Iterable[int]) -> List[int]:
+    # Row locks for a multi-product reservation, always taken in product_id
+    # order so two overlapping carts can't deadlock (AB/BA). Only inventory
+    # is locked: product rows are read, never updated, on these paths.
+    # No-op on SQLite, which serializes writers on the database lock.
+    return db.execute(
+        select(Inventory.product_id)
+        .where(Inventory.product_id.in_(sorted(set(product_ids))))
+        .order_by(Inventory.product_id)
+        .with_for_update()
+    ).scalars().all()
+
 def create_inventory(db: Session, inventory: Inventory):
     db.add(inventory)
-    db.commit()
-    db.refresh(inventory)
+    db.flush()
     return inventory
 
-def update_inventory(db: Session):
-    db.commit()
+def update_total_stock(db: Session, product_id: int, total_stock: int):
+    # Single atomic UPDATE ... RETURNING: the stock delta is computed by the DB
+    # against the current row, so concurrent updates can't overwrite each other.
+    row = db.execute(
+        update(Inventory)
+        .where(Inventory.product_id == product_id)
+        .values(
+            total_stock=total_stock,
+            available_stock=Inventory.available_stock + (total_stock - Inventory.total_stock),
+        )
+        .returning(
+            Inventory.product_id,
+            Inventory.total_stock,
+            Inventory.available_stock,
+            Inventory.reserved_stock,
+        )
+    ).first()
+    return row
+
+def reserve_items(db: Session, quantities: Dict[int, int]):
+    # Per-row quantity picked by product_id; rows without enough stock are
+    # skipped by the WHERE guard, so the check and the decrement are atomic.
+    # Returns the product_ids that were reserved; the caller decides what a
+    # short list means and owns the commit/rollback.
+    qty = case(quantities, value=Inventory.product_id)
+    return db.execute(
+        update(Inventory)
+        .where(
+            Inventory.product_id.in_(quantities),
+            Inventory.available_stock >= qty,
+        )
+        .values(
+            available_stock=Inventory.available_stock - qty,
+            reserved_stock=Inventory.reserved_stock + qty,
+        )
+        .returning(Inventory.product_id)
+    ).scalars().all()
+
+def _apply_order_items(db: Session, order_id: int, **values):
+    # One UPDATE ... FROM order_items joined on product_id, instead of a
+    # SELECT + UPDATE per line. Returns the product_ids that were touched.
+    return db.execute(
+        update(Inventory)
+        .where(
+            OrderItem.order_id == order_id,
+            Inventory.product_id == OrderItem.product_id,
+        )
+        .values(**values)
+        .returning(Inventory.product_id)
+    ).scalars().all()
+
+def finalize_order_stock(db: Session, order_id: int):
+    return _apply_order_items(
+        db,
+        order_id,
+        reserved_stock=Inventory.reserved_stock - OrderItem.quantity,
+        total_stock=Inventory.total_stock - OrderItem.quantity,
+    )
+
+def release_order_stock(db: Session, order_id: int):
+    return _apply_order_items(
+        db,
+        order_id,
+        reserved_stock=Inventory.reserved_stock - OrderItem.quantity,
+        available_stock=Inventory.available_stock + OrderItem.quantity,
+    )
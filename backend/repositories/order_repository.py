@@ -1,23 +1,55 @@
 # repositories/order_repository.py
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, tuple_, update
 
-from database import SessionLocal
 from models.order_model import Order, OrderItem
 
 
+# Keyset cursor for order listings: (created_at, id) of the last row seen
+OrderCursor = Tuple[datetime, int]
+
+
+def _page(q, limit: int, cursor: Optional[OrderCursor]):
+    """
+    Newest-first keyset page: WHERE (created_at, id) < cursor instead of
+    OFFSET, so deep pages cost the same as the first one.
+    """
+    if cursor is not None:
+        q = q.filter(tuple_(Order.created_at, Order.id) < tuple_(*cursor))
+    orders = q.order_by(Order.created_at.desc(), Order.id.desc()).limit(limit).all()
+    next_cursor = (orders[-1].created_at, orders[-1].id) if len(orders) == limit else None
+    return orders, next_cursor
+
+
+def _apply_filters(q, filters: Optional[Dict[str, Any]]):
+    filters = filters or {}
+    if "status" in filters:
+        q = q.filter(Order.status == filters["status"])
+    if "user_id" in filters:
+        q = q.filter(Order.user_id == filters["user_id"])
+    if "min_date" in filters:
+        q = q.filter(Order.created_at >= filters["min_date"])
+    if "max_date" in filters:
+        q = q.filter(Order.created_at <= filters["max_date"])
+    return q
+
+
 class OrderRepository:
     """
     Repository for Order related DB operations.
-    - Uses SessionLocal() to create per-call sessions.
-    - Eager-loads items to prevent DetachedInstanceError when returning objects.
+    - Works on the caller's (request-scoped) session, so several calls in
+      one request share a connection and transaction.
+    - Mutating methods only flush; the calling service commits once per
+      business operation.
+    - Eager-loads items so callers can serialize orders without lazy loads.
     """
 
-    def _get_db(self) -> Session:
-        return SessionLocal()
+    def __init__(self, db: Session):
+        self.db = db
 
     def create_order(
         self,
@@ -27,119 +59,88 @@ class OrderRepository:
         status: str = "PENDING",
         items: Optional[List[Dict[str, Any]]] = None,  # items: dicts with product_id, product_name, unit_price, quantity, total_price
     ) -> Order:
-        db = self._get_db()
-        try:
-            order = Order(
-                user_id=user_id,
-                shipping_address=shipping_address,
-                payment_method=payment_method,
-                status=status,
-            )
-            db.add(order)
-            db.flush()  # get order.id
-
-            items = items or []
-            for it in items:
-                order_item = OrderItem(
-                    order_id=order.id,
-                    product_id=it["product_id"],
-                    product_name=it.get("product_name"),
-                    unit_price=it["unit_price"],
-                    quantity=it["quantity"],
-                    total_price=it["total_price"],
-                )
-                db.add(order_item)
-
-            # Commit and refresh; eager-load items before returning
-            db.commit()
-            db.refresh(order)
-            # re-query with joinedload to ensure items are loaded and attached to session
-            order = (
-                db.query(Order)
-                .options(joinedload(Order.items))
-                .filter(Order.id == order.id)
-                .first()
+        order = Order(
+            user_id=user_id,
+            shipping_address=shipping_address,
+            payment_method=payment_method,
+            status=status,
+        )
+        # Assigning the collection keeps items loaded on the returned order;
+        # the flush still writes them as one batched INSERT.
+        order.items = [
+            OrderItem(
+                product_id=it["product_id"],
+                product_name=it.get("product_name"),
+                unit_price=it["unit_price"],
+                quantity=it["quantity"],
+                total_price=it["total_price"],
             )
-            return order
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+            for it in items or []
+        ]
+        self.db.add(order)
+        self.db.flush()
+        return order
 
     def get_order(self, order_id: int, user_id: Optional[int] = None) -> Optional[Order]:
-        db = self._get_db()
-        try:
-            q = db.query(Order).options(joinedload(Order.items)).filter(Order.id == order_id)
-            if user_id is not None:
-                q = q.filter(Order.user_id == user_id)
-            return q.first()
-        finally:
-            db.close()
-
-    def list_user_orders(self, user_id: int, limit: int = 50, offset: int = 0) -> List[Order]:
-        db = self._get_db()
-        try:
-            return (
-                db.query(Order)
-                .options(joinedload(Order.items))
-                .filter(Order.user_id == user_id)
-                .order_by(Order.created_at.desc())
-                .offset(offset)
-                .limit(limit)
-                .all()
-            )
-        finally:
-            db.close()
+        q = self.db.query(Order).options(selectinload(Order.items)).filter(Order.id == order_id)
+        if user_id is not None:
+            q = q.filter(Order.user_id == user_id)
+        return q.first()
+
+    def list_user_orders(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[OrderCursor] = None,
+    ) -> Tuple[List[Order], Optional[OrderCursor]]:
+        q = (
+            self.db.query(Order)
+            .options(selectinload(Order.items))
+            .filter(Order.user_id == user_id)
+        )
+        return _page(q, limit, cursor)
 
     def list_orders(
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0,
-    ) -> List[Order]:
+        cursor: Optional[OrderCursor] = None,
+    ) -> Tuple[List[Order], Optional[OrderCursor]]:
         """
         Admin-style listing with optional filters like status, date range, user_id.
+        Returns (orders, next_cursor); pass next_cursor back to get the next page.
         """
-        db = self._get_db()
-        try:
-            q = db.query(Order).options(joinedload(Order.items))
-            filters = filters or {}
-            if "status" in filters:
-                q = q.filter(Order.status == filters["status"])
-            if "user_id" in filters:
-                q = q.filter(Order.user_id == filters["user_id"])
-            if "min_date" in filters:
-                q = q.filter(Order.created_at >= filters["min_date"])
-            if "max_date" in filters:
-                q = q.filter(Order.created_at <= filters["max_date"])
-
-            return q.order_by(Order.created_at.desc()).offset(offset).limit(limit).all()
-        finally:
-            db.close()
+        q = self.db.query(Order).options(selectinload(Order.items))
+        return _page(_apply_filters(q, filters), limit, cursor)
+
+    def iter_orders(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        batch: int = 500,
+    ) -> Iterator[Order]:
+        """
+        Same filters as list_orders, but unbounded: rows come off a
+        server-side cursor `batch` at a time (items selectin-loaded per
+        batch), so memory stays flat however many orders match.
+        """
+        stmt = _apply_filters(
+            select(Order).options(selectinload(Order.items)), filters
+        ).order_by(Order.id)
+        result = self.db.execute(
+            stmt,
+            execution_options={"stream_results": True, "yield_per": batch},
+        )
+        yield from result.scalars()
 
     def update_status(self, order_id: int, new_status: str) -> Optional[Order]:
-        db = self._get_db()
-        try:
-            order = db.query(Order).filter(Order.id == order_id).first()
-            if not order:
-                return None
-            order.status = new_status
-            db.commit()
-            db.refresh(order)
-            # make sure items are loaded
-            order = (
-                db.query(Order)
-                .options(joinedload(Order.items))
-                .filter(Order.id == order_id)
-                .first()
-            )
-            return order
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        order = self.db.execute(
+            update(Order)
+            .where(Order.id == order_id)
+            .values(status=new_status)
+            .returning(Order)
+            .options(selectinload(Order.items))
+        ).scalar_one_or_none()
+        return order
 
     def attach_payment(
         self,
@@ -154,35 +155,22 @@ class OrderRepository:
         Assumes Order has fields: transaction_id, payment_method, payment_status, paid_at (optional).
         If your Order model differs, adapt field names accordingly.
         """
-        db = self._get_db()
-        try:
-            order = db.query(Order).filter(Order.id == order_id).first()
-            if not order:
-                return None
-
-            # set payment fields if present on model
-            if hasattr(order, "transaction_id"):
-                order.transaction_id = transaction_id
-            if hasattr(order, "payment_method"):
-                order.payment_method = payment_method
-            if hasattr(order, "payment_status"):
-                order.payment_status = payment_status
-            if hasattr(order, "amount_paid"):
-                order.amount_paid = amount
-            # Optionally update order status when payment is successful:
-            # if payment_status == "PAID": order.status = "PAID"
-
-            db.commit()
-            db.refresh(order)
-            order = (
-                db.query(Order)
-                .options(joinedload(Order.items))
-                .filter(Order.id == order_id)
-                .first()
-            )
-            return order
-        except Exception:
-            db.rollback()
-            raise
-        finally:
-            db.close()
+        # set payment fields if present on model
+        fields = {
+            "transaction_id": transaction_id,
+            "payment_method": payment_method,
+            "payment_status": payment_status,
+            "amount_paid": amount,
+        }
+        values = {name: value for name, value in fields.items() if hasattr(Order, name)}
+        # Optionally update order status when payment is successful:
+        # if payment_status == "PAID": values["status"] = "PAID"
+
+        order = self.db.execute(
+            update(Order)
+            .where(Order.id == order_id)
+            .values(**values)
+            .returning(Order)
+            .options(selectinload(Order.items))
+        ).scalar_one_or_none()
+        return order
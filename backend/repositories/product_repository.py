@@ -2,11 +2,42 @@
 
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import Row, or_, select
 
-from models.product_model import Product
+from models.product_model import Product, products_fts
 from schemas.product_schema import ProductCreate, ProductUpdate
 
+# Exactly the columns ProductRead exposes: list pages come back as plain
+# Rows, skipping ORM entity construction and identity-map bookkeeping.
+PRODUCT_LIST_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.description,
+    Product.price,
+    Product.image_url,
+    Product.status,
+    Product.stock,
+    Product.category_id,
+)
+
+# Trigram FTS can't match anything shorter than one trigram
+FTS_MIN_QUERY_LEN = 3
+
+
+def _search_filter(db: Session, search: str):
+    if db.get_bind().dialect.name == "sqlite" and len(search) >= FTS_MIN_QUERY_LEN:
+        # Quoted FTS5 phrase: the raw input is matched as a substring,
+        # never parsed as MATCH syntax (embedded quotes are doubled)
+        phrase = '"' + search.replace('"', '""') + '"'
+        return Product.id.in_(
+            select(products_fts.c.rowid).where(
+                products_fts.c.products_fts.op("MATCH")(phrase)
+            )
+        )
+
+    like = f"%{search}%"
+    return or_(Product.name.ilike(like), Product.description.ilike(like))
+
 
 def get_product(db: Session, product_id: int) -> Optional[Product]:
     return db.query(Product).filter(
@@ -23,12 +54,12 @@ def list_products(
     category_id: Optional[int] = None,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
-) -> List[Product]:
-    query = db.query(Product).filter(Product.status != "deleted")
+    after_id: Optional[int] = None,
+) -> List[Row]:
+    query = db.query(*PRODUCT_LIST_COLUMNS).filter(Product.status != "deleted")
 
     if search:
-        like = f"%{search}%"
-        query = query.filter(or_(Product.name.ilike(like), Product.description.ilike(like)))
+        query = query.filter(_search_filter(db, search))
 
     if category_id is not None:
         query = query.filter(Product.category_id == category_id)
@@ -39,31 +70,35 @@ def list_products(
     if max_price is not None:
         query = query.filter(Product.price <= max_price)
 
-    return query.offset(skip).limit(limit).all()
+    # Keyset pagination: seek past the last id instead of scanning `skip` rows
+    query = query.order_by(Product.id)
+    if after_id is not None:
+        query = query.filter(Product.id > after_id)
+    elif skip:
+        query = query.offset(skip)
+
+    return query.limit(limit).all()
 
 
 def create_product(db: Session, product_in: ProductCreate) -> Product:
-    db_obj = Product(**product_in.dict())
+    db_obj = Product(**product_in.model_dump())
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    db.flush()
     return db_obj
 
 
 def update_product(db: Session, db_obj: Product, product_in: ProductUpdate) -> Product:
-    data = product_in.dict(exclude_unset=True)
+    data = product_in.model_dump(exclude_unset=True)
     for field, value in data.items():
         setattr(db_obj, field, value)
 
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    db.flush()
     return db_obj
 
 
 def soft_delete_product(db: Session, db_obj: Product) -> Product:
     db_obj.status = "deleted"
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    db.flush()
     return db_obj
@@ -17,8 +17,15 @@ class UserRepository:
     def get_by_email(self, email: str) -> Optional[User]:
         return self.db.query(User).filter(User.email == email).first()
 
-    def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
-        return self.db.query(User).offset(skip).limit(limit).all()
+    def list_users(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[User]:
+        query = self.db.query(User).order_by(User.id)
+        if after_id is not None:
+            query = query.filter(User.id > after_id)
+        elif skip:
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
     def create(self, user_in: UserCreate, hashed_password: str) -> User:
         db_user = User(
@@ -30,6 +37,5 @@ class UserRepository:
             is_active=user_in.is_active,
         )
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        self.db.flush()
         return db_user
@@ -1,7 +1,8 @@
 # schemas/cart_schema.py
 
+from decimal import Decimal
 from typing import List, Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class CartItemBase(BaseModel):
@@ -13,6 +14,10 @@ class CartItemCreate(CartItemBase):
     pass
 
 
+class CartItemsBulkCreate(BaseModel):
+    items: List[CartItemCreate] = Field(..., min_length=1)
+
+
 class CartItemUpdate(BaseModel):
     quantity: int
 
@@ -23,14 +28,18 @@ class CartItemRead(BaseModel):
     id: int
     product_id: int
     quantity: int
-    unit_price: float
+    unit_price: Decimal
+
+
+# Validates all cart lines in one pydantic-core pass
+CART_ITEMS_ADAPTER = TypeAdapter(List[CartItemRead])
 
 
 class CartSummary(BaseModel):
-    subtotal: float
-    tax: float
-    discount: float
-    total: float
+    subtotal: Decimal
+    tax: Decimal
+    discount: Decimal
+    total: Decimal
 
 
 class CartRead(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class InventoryBase(BaseModel):
     product_id: int
@@ -16,6 +16,4 @@ class InventoryResponse(BaseModel):
     available_stock: int
     reserved_stock: int
 
-    class Config:
-        orm_mode = True
-        form_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,6 @@
 # schemas/payment_schema.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from decimal import Decimal
 
@@ -32,5 +32,4 @@ class PaymentRead(BaseModel):
     amount: Decimal
     currency: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,7 @@
 # Schemas/product_schema.py
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 # ---------- Category ----------
@@ -25,8 +25,7 @@ class CategoryUpdate(BaseModel):
 class CategoryRead(CategoryBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ---------- Product ----------
@@ -61,5 +60,8 @@ class ProductUpdate(BaseModel):
 class ProductRead(ProductBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validates / dumps a whole page of products in one pydantic-core pass
+PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductRead])
@@ -1,7 +1,7 @@
 # schemas.py  (or app/schemas/user.py)
 
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
+from typing import List, Optional
 
 
 class UserBase(BaseModel):
@@ -19,8 +19,11 @@ class UserCreate(UserBase):
 class UserRead(UserBase):
     id: int
 
-    class Config:
-        from_attributes = True 
+    model_config = ConfigDict(from_attributes=True)
+
+
+USER_LIST_ADAPTER = TypeAdapter(List[UserRead])
+
 
 class UserLogin(BaseModel):
     email: EmailStr
@@ -35,3 +38,4 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     user_id: Optional[int] = None
     email: Optional[EmailStr] = None
+    exp: Optional[int] = None  # expiry as a unix timestamp
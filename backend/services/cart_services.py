@@ -1,23 +1,34 @@
 # Services/cart_services.py
 
+from decimal import Decimal, ROUND_HALF_UP
+from typing import ClassVar, Dict
+
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from repositories.cart_repository import CartRepository
 from schemas.cart_schema import (
     CartItemCreate,
+    CartItemsBulkCreate,
     CartItemUpdate,
     CartRead,
-    CartItemRead,
     CartSummary,
+    CART_ITEMS_ADAPTER,
 )
 from models.cart_model import Cart
 from utils.logger import logger
 
 
+_CENTS = Decimal("0.01")
+
+
+def _quantize_money(value: Decimal) -> Decimal:
+    return value.quantize(_CENTS, rounding=ROUND_HALF_UP)
+
+
 class CartService:
-    TAX_RATE = 0.0
-    DISCOUNT_RATE = 0.0
+    TAX_RATE: ClassVar[Decimal] = Decimal("0.00")
+    DISCOUNT_RATE: ClassVar[Decimal] = Decimal("0.00")
 
     def __init__(self, db: Session):
         self.db = db
@@ -29,62 +40,93 @@ class CartService:
             cart = self.repo.create_cart_for_user(user_id)
         return cart
 
-    def _build_cart_response(self, cart: Cart) -> CartRead:
-        subtotal = sum(item.unit_price * item.quantity for item in cart.items)
-        tax = subtotal * self.TAX_RATE
-        discount = subtotal * self.DISCOUNT_RATE
-        total = subtotal + tax - discount
-
-        items_read = [
-            CartItemRead.model_validate(item, from_attributes=True)
-            for item in cart.items
-        ]
-
-        summary = CartSummary(
-            subtotal=subtotal,
+    def _summarize(self, subtotal: Decimal) -> CartSummary:
+        tax = _quantize_money(subtotal * self.TAX_RATE)
+        discount = _quantize_money(subtotal * self.DISCOUNT_RATE)
+        return CartSummary(
+            subtotal=_quantize_money(subtotal),
             tax=tax,
             discount=discount,
-            total=total,
+            total=_quantize_money(subtotal + tax - discount),
         )
 
+    def _build_cart_summary(self, cart_id: int) -> CartSummary:
+        # Totals only: one aggregate query, no CartItem objects loaded
+        return self._summarize(self.repo.cart_totals(cart_id))
+
+    def _build_cart_full(self, cart: Cart) -> CartRead:
+        subtotal = sum(
+            (item.unit_price * item.quantity for item in cart.items), Decimal("0")
+        )
+        items_read = CART_ITEMS_ADAPTER.validate_python(cart.items, from_attributes=True)
+
         return CartRead(
             id=cart.id,
             items=items_read,
-            summary=summary,
+            summary=self._summarize(subtotal),
         )
 
     # ---------- GET CART ----------
     def get_cart_for_user(self, user_id: int) -> CartRead:
         cart = self._get_or_create_cart(user_id)
-        return self._build_cart_response(cart)
+        self.db.commit()  # persists the cart if it was just created
+        return self._build_cart_full(cart)
+
+    # ---------- GET CART SUMMARY ----------
+    def get_cart_summary(self, user_id: int) -> CartSummary:
+        cart = self.repo.get_cart_by_user_id(user_id)
+        if not cart:
+            return self._summarize(Decimal("0"))
+        return self._build_cart_summary(cart.id)
 
     # ---------- ADD ITEM ----------
     def add_item(self, user_id: int, data: CartItemCreate) -> CartRead:
+        # Single add is just a one-element bulk add (same validation/queries)
+        return self.add_items(user_id, CartItemsBulkCreate(items=[data]))
+
+    # ---------- ADD ITEMS (BULK) ----------
+    def add_items(self, user_id: int, data: CartItemsBulkCreate) -> CartRead:
         cart = self._get_or_create_cart(user_id)
 
-        product = self.repo.get_product(data.product_id)
-        if not product:
-            logger.warning(f"Product not found: product_id={data.product_id}")
-            raise HTTPException(status_code=404, detail="Product not found")
+        # Merge repeated product_ids so each product is validated once
+        quantities: Dict[int, int] = {}
+        for item in data.items:
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+
+        # One IN (...) query instead of one SELECT per item
+        products = {
+            p.id: p for p in self.repo.get_products_by_ids(list(quantities))
+        }
+
+        for product_id, quantity in quantities.items():
+            product = products.get(product_id)
+            if not product:
+                logger.warning(f"Product not found: product_id={product_id}")
+                raise HTTPException(status_code=404, detail="Product not found")
+
+            if product.status != "active":
+                logger.warning(f"Inactive product: product_id={product_id}")
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Product not active (status={product.status})",
+                )
+
+            if product.stock is not None and quantity > product.stock:
+                logger.warning(f"Insufficient stock: product_id={product_id}")
+                raise HTTPException(status_code=400, detail="Not enough stock")
+
+        self.repo.add_items_bulk(
+            cart,
+            [(products[pid], quantity) for pid, quantity in quantities.items()],
+        )
+        self.db.commit()
 
-        if product.status != "active":
-            logger.warning(f"Inactive product: product_id={data.product_id}")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Product not active (status={product.status})",
+        for product_id, quantity in quantities.items():
+            logger.info(
+                f"Item added to cart: product_id={product_id}, quantity={quantity}"
             )
 
-        if product.stock is not None and data.quantity > product.stock:
-            logger.warning(f"Insufficient stock: product_id={data.product_id}")
-            raise HTTPException(status_code=400, detail="Not enough stock")
-
-        self.repo.add_item(cart, product, data.quantity)
-
-        logger.info(
-            f"Item added to cart: product_id={data.product_id}, quantity={data.quantity}"
-        )
-
-        return self._build_cart_response(cart)
+        return self._build_cart_full(cart)
 
     # ---------- UPDATE ITEM ----------
     def update_item_quantity(
@@ -103,12 +145,13 @@ class CartService:
             raise HTTPException(status_code=400, detail="Not enough stock")
 
         self.repo.update_item_quantity(item, data.quantity)
+        self.db.commit()
 
         logger.info(
             f"Cart item quantity updated: item_id={item_id}, quantity={data.quantity}"
         )
 
-        return self._build_cart_response(cart)
+        return self._build_cart_full(cart)
 
     # ---------- REMOVE ITEM ----------
     def remove_item(self, user_id: int, item_id: int) -> CartRead:
@@ -120,17 +163,18 @@ class CartService:
             raise HTTPException(status_code=404, detail="Cart item not found")
 
         self.repo.remove_item(item)
+        self.db.commit()
 
         logger.info(f"Cart item removed: item_id={item_id}")
 
-        return self._build_cart_response(cart)
+        return self._build_cart_full(cart)
 
     # ---------- CLEAR CART ----------
     def clear_cart(self, user_id: int) -> CartRead:
         cart = self._get_or_create_cart(user_id)
         self.repo.clear_cart(cart)
+        self.db.commit()
 
         logger.info("Cart cleared")
 
-        self.db.refresh(cart)
-        return self._build_cart_response(cart)
+        return self._build_cart_full(cart)
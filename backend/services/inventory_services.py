@@ -1,9 +1,19 @@
+from typing import Dict, List, Tuple
+
 from fastapi import HTTPException
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from models.inventory_model import Inventory
-from models.order_model import OrderItem
-from repositories.inventory_repository import get_by_product_id
+from repositories.inventory_repository import (
+    get_by_product_id,
+    create_inventory,
+    update_total_stock,
+    lock_inventory_rows,
+    reserve_items,
+    finalize_order_stock,
+    release_order_stock,
+)
 from utils.logger import logger
 
 
@@ -15,14 +25,25 @@ def create_inventory_for_product(db: Session, product_id: int, stock: int):
         available_stock=stock,
         reserved_stock=0,
     )
-    db.add(inventory)
+    create_inventory(db, inventory)
     db.commit()
-    db.refresh(inventory)
 
     logger.info(f"Inventory created | product_id={product_id}, stock={stock}")
     return inventory
 
 
+# 🔹 Set total stock (admin only); available stock moves by the same delta
+def update_inventory_stock(db: Session, product_id: int, total_stock: int):
+    row = update_total_stock(db, product_id, total_stock)
+    if row is None:
+        return None
+
+    db.commit()
+
+    logger.info(f"Inventory updated | product_id={product_id}, total_stock={total_stock}")
+    return row
+
+
 # 🔹 Validate stock before order creation
 def validate_stock(db: Session, product_id: int, quantity: int):
     inventory = get_by_product_id(db, product_id)
@@ -36,39 +57,64 @@ def validate_stock(db: Session, product_id: int, quantity: int):
 
 # 🔹 Reserve stock after order creation
 def reserve_stock(db: Session, product_id: int, quantity: int):
-    inventory = get_by_product_id(db, product_id)
+    # Conditional UPDATE: the stock check and the decrement are one atomic
+    # statement, so concurrent reservations can't oversell.
+    row = db.execute(
+        update(Inventory)
+        .where(
+            Inventory.product_id == product_id,
+            Inventory.available_stock >= quantity,
+        )
+        .values(
+            available_stock=Inventory.available_stock - quantity,
+            reserved_stock=Inventory.reserved_stock + quantity,
+        )
+        .returning(Inventory.available_stock, Inventory.reserved_stock)
+    ).first()
 
-    if not inventory or inventory.available_stock < quantity:
+    if row is None:
         logger.warning(f"Insufficient stock | product_id={product_id}")
         raise HTTPException(status_code=400, detail="Insufficient stock")
 
-    inventory.available_stock -= quantity
-    inventory.reserved_stock += quantity
-
     db.commit()
 
     logger.info(
         f"Stock reserved | product_id={product_id}, quantity={quantity}"
     )
-    return inventory
+    return row
 
 
-# 🔹 Finalize stock after payment success (ORDER LEVEL)
-def finalize_stock(db: Session, order_id: int):
-    items = (
-        db.query(OrderItem)
-        .filter(OrderItem.order_id == order_id)
-        .all()
-    )
+# 🔹 Validate + reserve stock for a whole cart in one statement
+def reserve_stock_bulk(db: Session, items: List[Tuple[int, int]]):
+    quantities: Dict[int, int] = {}
+    for product_id, quantity in items:
+        quantities[product_id] = quantities.get(product_id, 0) + quantity
+
+    if not quantities:
+        return []
+
+    lock_inventory_rows(db, quantities)
+    reserved = reserve_items(db, quantities)
+
+    missing = set(quantities) - set(reserved)
+    if missing:
+        db.rollback()
+        logger.warning(f"Insufficient stock | product_ids={sorted(missing)}")
+        raise HTTPException(status_code=400, detail="Insufficient stock")
+
+    db.commit()
 
-    for item in items:
-        inventory = get_by_product_id(db, item.product_id)
+    logger.info(f"Stock reserved | items={quantities}")
+    return reserved
 
-        inventory.reserved_stock -= item.quantity
-        inventory.total_stock -= item.quantity
 
+# 🔹 Finalize stock after payment success (ORDER LEVEL)
+def finalize_stock(db: Session, order_id: int):
+    product_ids = finalize_order_stock(db, order_id)
+
+    for product_id in product_ids:
         logger.info(
-            f"Stock finalized | product_id={item.product_id}, qty={item.quantity}"
+            f"Stock finalized | order_id={order_id}, product_id={product_id}"
         )
 
     db.commit()
@@ -76,24 +122,15 @@ def finalize_stock(db: Session, order_id: int):
 
 # 🔹 Rollback stock on payment failure / order cancellation (ORDER LEVEL)
 def rollback_stock(db: Session, order_id: int):
-    items = (
-        db.query(OrderItem)
-        .filter(OrderItem.order_id == order_id)
-        .all()
-    )
+    product_ids = release_order_stock(db, order_id)
 
-    if not items:
+    if not product_ids:
         logger.warning(f"[ROLLBACK] No items found | order_id={order_id}")
         return
 
-    for item in items:
-        inventory = get_by_product_id(db, item.product_id)
-
-        inventory.reserved_stock -= item.quantity
-        inventory.available_stock += item.quantity
-
+    for product_id in product_ids:
         logger.warning(
-            f"Stock rolled back | product_id={item.product_id}, qty={item.quantity}"
+            f"Stock rolled back | order_id={order_id}, product_id={product_id}"
         )
 
     db.commit()
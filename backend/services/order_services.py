@@ -1,28 +1,39 @@
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
 from typing import List, Optional
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Row, func, insert, select, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from models.order_model import Order, OrderItem
 from models.cart_model import Cart
 from models.product_model import Product
-from models.inventory_model import Inventory
+from repositories.cart_repository import CartRepository
+from repositories.order_repository import OrderCursor
+from repositories.inventory_repository import lock_inventory_rows, reserve_items
 from utils.logger import logger
+from utils.money import from_paise, to_paise
 
 
-ALLOWED_STATUSES = {
+ALLOWED_STATUSES = frozenset({
     "PENDING",
     "CONFIRMED",
     "PAID",
     "SHIPPED",
     "DELIVERED",
     "CANCELLED",
-}
+})
 
+TAX_RATE_PERCENT = 18
 
-def _quantize_money(value: Decimal) -> Decimal:
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+# Error details built once at import. Every raise still creates a fresh
+# HTTPException: a shared instance would accumulate __traceback__ (pinning
+# the raising frame) and be mutated by concurrent requests.
+ORDER_NOT_FOUND = "Order not found"
+_INVALID_STATUS_MSG = "Invalid order status '{}'. Allowed values: " + ", ".join(
+    sorted(ALLOWED_STATUSES)
+)
 
 
 class OrderService:
@@ -54,6 +65,17 @@ class OrderService:
             logger.warning("Cart has no valid items")
             raise HTTPException(400, "Cart is empty or has no valid items")
 
+        # Two batched lookups instead of a Product + Inventory query per line.
+        # Products are only read; just the inventory rows get locked.
+        product_ids = sorted({item.product_id for item in valid_items})
+        products = {
+            product.id: product
+            for product in self.db.query(Product)
+            .filter(Product.id.in_(product_ids), Product.status == "active")
+            .all()
+        }
+        stocked = set(lock_inventory_rows(self.db, product_ids))
+
         order = Order(
             user_id=user_id,
             shipping_address=shipping_address,
@@ -63,104 +85,132 @@ class OrderService:
         self.db.add(order)
         self.db.flush()
 
-        subtotal = Decimal("0.00")
+        # All pricing below is integer paise; see utils/money.py
+        subtotal = 0
         total_items = 0
-        discount = Decimal("0.00")
+        discount = 0
+        item_rows = []
 
         for cart_item in valid_items:
-            product = (
-                self.db.query(Product)
-                .filter(Product.id == cart_item.product_id, Product.status == "active")
-                .first()
-            )
+            product = products.get(cart_item.product_id)
 
             if not product:
                 logger.warning(f"Product not available: product_id={cart_item.product_id}")
                 raise HTTPException(400, "Product not available")
 
-            inventory = (
-                self.db.query(Inventory)
-                .filter(Inventory.product_id == product.id)
-                .with_for_update()
-                .first()
-            )
-
-            if not inventory:
+            if product.id not in stocked:
                 logger.error(f"Inventory missing for product_id={product.id}")
                 raise HTTPException(400, "Inventory not found")
 
-            if inventory.available_stock < cart_item.quantity:
-                logger.warning(f"Insufficient stock: product_id={product.id}")
-                raise HTTPException(400, "Insufficient stock")
-
-            inventory.available_stock -= cart_item.quantity
-            inventory.reserved_stock += cart_item.quantity
-            logger.info(
-                f"Inventory reserved: product_id={product.id}, quantity={cart_item.quantity}"
-            )
-
-            unit_price = _quantize_money(Decimal(str(product.price)))
-            line_total = _quantize_money(unit_price * Decimal(cart_item.quantity))
+            unit_price = to_paise(product.price)
+            line_total = unit_price * cart_item.quantity
 
             subtotal += line_total
             total_items += cart_item.quantity
 
-            self.db.add(
-                OrderItem(
-                    order_id=order.id,
-                    product_id=product.id,
-                    product_name=product.name,
-                    unit_price=unit_price,
-                    quantity=cart_item.quantity,
-                    total_price=line_total,
-                )
+            item_rows.append(
+                {
+                    "order_id": order.id,
+                    "product_id": product.id,
+                    "product_name": product.name,
+                    "unit_price": from_paise(unit_price),
+                    "quantity": cart_item.quantity,
+                    "total_price": from_paise(line_total),
+                }
             )
 
-        tax = _quantize_money(subtotal * Decimal("0.18"))
-        grand_total = _quantize_money(subtotal + tax - discount)
+        # One multi-row INSERT ... RETURNING for all lines instead of a flush
+        # per OrderItem; the returned rows become the order's loaded items.
+        items = self.db.scalars(insert(OrderItem).returning(OrderItem), item_rows).all()
+        set_committed_value(order, "items", items)
+
+        # Reserve every line in one guarded UPDATE, inside a SAVEPOINT: a
+        # stock conflict only unwinds the reservation, and the HTTPException
+        # then abandons the whole order transaction (nothing was committed).
+        quantities = {}
+        for row in item_rows:
+            quantities[row["product_id"]] = quantities.get(row["product_id"], 0) + row["quantity"]
+
+        with self.db.begin_nested():
+            reserved = reserve_items(self.db, quantities)
+            missing = set(quantities) - set(reserved)
+            if missing:
+                logger.warning(f"Insufficient stock: product_ids={sorted(missing)}")
+                raise HTTPException(400, "Insufficient stock")
+
+        logger.info(f"Inventory reserved: order_id={order.id}, items={quantities}")
+
+        # Half-up rounding to the paisa, in integers
+        tax = (subtotal * TAX_RATE_PERCENT + 50) // 100
+        grand_total = subtotal + tax - discount
 
         order.total_items = total_items
-        order.subtotal = _quantize_money(subtotal)
-        order.tax = tax
-        order.discount = _quantize_money(discount)
-        order.grand_total = grand_total
+        order.subtotal = from_paise(subtotal)
+        order.tax = from_paise(tax)
+        order.discount = from_paise(discount)
+        order.grand_total = from_paise(grand_total)
 
-        for item in valid_items:
-            self.db.delete(item)
+        # Checkout empties the whole cart: one DELETE keyed on cart_id, which
+        # also drops any zero-quantity leftovers that weren't ordered.
+        CartRepository(self.db).clear_cart(cart)
 
+        # Every column and item is already loaded, and commit no longer
+        # expires them, so the response needs no re-fetch.
         self.db.commit()
         logger.info(f"Order created successfully: order_id={order.id}")
-        self.db.refresh(order)
 
-        return (
-            self.db.query(Order)
-            .options(joinedload(Order.items))
-            .filter(Order.id == order.id)
-            .first()
-        )
+        return order
 
     # ---------- LIST USER ORDERS ----------
-    def list_user_orders(self, user_id: int) -> List[Order]:
-        return (
-            self.db.query(Order)
-            .options(joinedload(Order.items))
-            .filter(Order.user_id == user_id)
-            .order_by(Order.created_at.desc())
-            .all()
-        )
+    def list_user_orders(
+        self,
+        user_id: int,
+        cursor: Optional[OrderCursor] = None,
+        limit: int = 20,
+    ) -> List[Row]:
+        """
+        One page of the user's orders, newest first. Keyset on
+        (created_at, id): pass the last row's pair as `cursor` to get the
+        next page. Only header fields are selected, no items/products.
+        """
+        stmt = select(
+            Order.id,
+            Order.total_items,
+            Order.grand_total,
+            Order.status,
+            Order.created_at,
+            Order.payment_method,
+        ).where(Order.user_id == user_id)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(Order.created_at, Order.id) < tuple_(*cursor))
+        return self.db.execute(
+            stmt.order_by(Order.created_at.desc(), Order.id.desc()).limit(limit)
+        ).all()
+
+    # ---------- USER ORDERS SUMMARY ----------
+    def get_user_orders_summary(self, user_id: int) -> Row:
+        # Totals over all of the user's orders in one aggregate query,
+        # independent of which page of orders is being listed
+        return self.db.execute(
+            select(
+                func.count().label("total_orders"),
+                func.count().filter(Order.status == "PENDING").label("pending_orders"),
+                func.coalesce(func.sum(Order.grand_total), 0).label("total_amount"),
+            ).where(Order.user_id == user_id)
+        ).one()
 
     # ---------- GET SINGLE ORDER ----------
     def get_order_for_user(self, order_id: int, user_id: int) -> Order:
         order = (
             self.db.query(Order)
-            .options(joinedload(Order.items))
+            .options(selectinload(Order.items))
             .filter(Order.id == order_id)
             .first()
         )
 
         if not order:
             logger.warning(f"Order not found: order_id={order_id}")
-            raise HTTPException(404, "Order not found")
+            raise HTTPException(404, ORDER_NOT_FOUND)
 
         if order.user_id != user_id:
             logger.warning(f"Unauthorized access attempt: order_id={order_id}")
@@ -172,17 +222,16 @@ class OrderService:
     def update_status(self, order_id: int, new_status: str) -> Order:
         if new_status not in ALLOWED_STATUSES:
             logger.warning(f"Invalid order status: {new_status}")
-            raise HTTPException(400, f"Invalid order status '{new_status}'")
+            raise HTTPException(400, _INVALID_STATUS_MSG.format(new_status))
 
         order = self.db.query(Order).filter(Order.id == order_id).first()
 
         if not order:
             logger.warning(f"Order not found for status update: order_id={order_id}")
-            raise HTTPException(404, "Order not found")
+            raise HTTPException(404, ORDER_NOT_FOUND)
 
         order.status = new_status
         self.db.commit()
-        self.db.refresh(order)
 
         logger.info(f"Order status updated: order_id={order_id}, status={new_status}")
         return order
@@ -201,17 +250,16 @@ class OrderService:
 
         if not order:
             logger.warning(f"Order not found for payment: order_id={order_id}")
-            raise HTTPException(404, "Order not found")
+            raise HTTPException(404, ORDER_NOT_FOUND)
 
         order.transaction_id = transaction_id
         order.payment_method = payment_method
         order.payment_status = payment_status
-        order.amount_paid = _quantize_money(amount)
+        order.amount_paid = from_paise(to_paise(amount))
 
         if payment_status.upper() == "PAID":
             order.status = "PAID"
             logger.info(f"Order marked as PAID: order_id={order_id}")
 
         self.db.commit()
-        self.db.refresh(order)
         return order
@@ -5,13 +5,23 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from models.product_model import Product
-from schemas.product_schema import ProductCreate, ProductUpdate, ProductRead, VALID_PRODUCT_STATUSES
+from schemas.product_schema import (
+    ProductCreate,
+    ProductUpdate,
+    ProductRead,
+    VALID_PRODUCT_STATUSES,
+    PRODUCT_LIST_ADAPTER,
+)
 from repositories import product_repository
 
 
+# Allowed product statuses; the error message is built once, not per request
+ALLOWED_PRODUCT_STATUSES = frozenset(VALID_PRODUCT_STATUSES)
+_ALLOWED_STATUSES_MSG = ", ".join(sorted(ALLOWED_PRODUCT_STATUSES))
+
+
 class ProductService:
-    # Allowed product statuses
-    ALLOWED_STATUSES = {"active", "inactive", "deleted"}
+    ALLOWED_STATUSES = ALLOWED_PRODUCT_STATUSES
     
     @staticmethod
     def _validate_status(status_value: Optional[str]) -> None:
@@ -19,7 +29,7 @@ class ProductService:
         if status_value is not None and status_value not in ProductService.ALLOWED_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status '{status_value}'. Allowed values: {', '.join(sorted(ProductService.ALLOWED_STATUSES))}"
+                detail=f"Invalid status '{status_value}'. Allowed values: {_ALLOWED_STATUSES_MSG}"
             )
     def __init__(self, db: Session):
         self.db = db
@@ -33,6 +43,7 @@ class ProductService:
         category_id: Optional[int] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
+        after_id: Optional[int] = None,
     ) -> List[ProductRead]:
         products = product_repository.list_products(
             self.db,
@@ -42,8 +53,9 @@ class ProductService:
             category_id=category_id,
             min_price=min_price,
             max_price=max_price,
+            after_id=after_id,
         )
-        return [ProductRead.model_validate(p) for p in products]
+        return PRODUCT_LIST_ADAPTER.validate_python(products, from_attributes=True)
 
     def get_product(self, product_id: int) -> ProductRead:
         product = product_repository.get_product(self.db, product_id)
@@ -57,7 +69,9 @@ class ProductService:
     def create_product(self, product_in: ProductCreate) -> ProductRead:
         self._validate_status(product_in.status)
         product = product_repository.create_product(self.db, product_in)
-        return ProductRead.model_validate(product)
+        result = ProductRead.model_validate(product)
+        self.db.commit()
+        return result
 
     def update_product(self, product_id: int, product_in: ProductUpdate) -> ProductRead:
         self._validate_status(product_in.status)
@@ -67,7 +81,9 @@ class ProductService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
         product = product_repository.update_product(self.db, product, product_in)
-        return ProductRead.model_validate(product)
+        result = ProductRead.model_validate(product)
+        self.db.commit()
+        return result
 
     def delete_product(self, product_id: int) -> ProductRead:
         product = product_repository.get_product(self.db, product_id)
@@ -76,4 +92,6 @@ class ProductService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not found")
 
         product = product_repository.soft_delete_product(self.db, product)
-        return ProductRead.model_validate(product)
+        result = ProductRead.model_validate(product)
+        self.db.commit()
+        return result
@@ -5,8 +5,13 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from repositories.user_repository import UserRepository
-from schemas.user_schema import UserCreate, UserRead, UserLogin, Token
-from utils.jwt_utils import hash_password, verify_password, create_access_token
+from schemas.user_schema import UserCreate, UserRead, UserLogin, Token, USER_LIST_ADAPTER
+from utils.jwt_utils import (
+    DUMMY_PASSWORD_HASH,
+    hash_password,
+    verify_password,
+    create_access_token,
+)
 
 
 class UserService:
@@ -24,13 +29,16 @@ class UserService:
 
         hashed = hash_password(user_in.password)
         user = self.repo.create(user_in, hashed_password=hashed)
-        return UserRead.from_orm(user)
+        result = UserRead.model_validate(user)
+        self.db.commit()
+        return result
 
     def authenticate_user(self, login_data: UserLogin):
         user = self.repo.get_by_email(login_data.email)
-        if not user:
-            return None
-        if not verify_password(login_data.password, user.hashed_password):
+        # Always run exactly one verify, even for unknown emails (timing-safe)
+        hashed = user.hashed_password if user else DUMMY_PASSWORD_HASH
+        password_ok = verify_password(login_data.password, hashed)
+        if not user or not password_ok:
             return None
         return user
 
@@ -51,8 +59,10 @@ class UserService:
         user = self.repo.get_by_id(user_id)
         if not user:
             return None
-        return UserRead.from_orm(user)
+        return UserRead.model_validate(user)
 
-    def list_users(self, skip: int = 0, limit: int = 100) -> List[UserRead]:
-        users = self.repo.list_users(skip=skip, limit=limit)
-        return [UserRead.from_orm(u) for u in users]
+    def list_users(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[UserRead]:
+        users = self.repo.list_users(skip=skip, limit=limit, after_id=after_id)
+        return USER_LIST_ADAPTER.validate_python(users, from_attributes=True)
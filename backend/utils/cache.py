@@ -0,0 +1,108 @@
+# utils/cache.py
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import redis
+from dotenv import load_dotenv
+
+from utils.logger import logger
+
+load_dotenv()
+
+# Leave REDIS_URL unset to run without a cache (every helper becomes a no-op)
+REDIS_URL = os.getenv("REDIS_URL")
+
+redis_client: Optional[redis.Redis] = (
+    redis.Redis.from_url(
+        REDIS_URL,
+        decode_responses=True,
+        socket_timeout=0.5,
+        socket_connect_timeout=0.5,
+    )
+    if REDIS_URL
+    else None
+)
+
+
+# ===============================
+# Cache helpers
+# ===============================
+# A cache failure must never fail the request, so every helper
+# logs Redis errors and falls back to "cache miss" behaviour.
+
+def cache_get(key: str) -> Optional[str]:
+    if redis_client is None:
+        return None
+    try:
+        return redis_client.get(key)
+    except redis.RedisError as exc:
+        logger.warning(f"Cache GET failed | key={key}, error={exc}")
+        return None
+
+
+def cache_set(key: str, value, ttl: int) -> None:
+    if redis_client is None:
+        return
+    try:
+        redis_client.setex(key, ttl, value)
+    except redis.RedisError as exc:
+        logger.warning(f"Cache SETEX failed | key={key}, error={exc}")
+
+
+def cache_delete(*keys: str) -> None:
+    if redis_client is None or not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError as exc:
+        logger.warning(f"Cache DEL failed | keys={keys}, error={exc}")
+
+
+def cache_incr(key: str) -> None:
+    if redis_client is None:
+        return
+    try:
+        redis_client.incr(key)
+    except redis.RedisError as exc:
+        logger.warning(f"Cache INCR failed | key={key}, error={exc}")
+
+
+# ===============================
+# Process-local TTL cache
+# ===============================
+# Sits in front of Redis for the hottest lookups. Entries are per worker
+# and can't be invalidated across processes, so keep TTLs short.
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
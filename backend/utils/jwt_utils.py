@@ -1,15 +1,24 @@
+import os
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
+from dotenv import load_dotenv
+from jwt import PyJWTError as JWTError
 from pwdlib import PasswordHash
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from database import get_db
 from models.user_model import User
-from schemas.user_schema import TokenData
+from schemas.user_schema import TokenData, UserRead
+from utils.cache import TTLCache, cache_delete, cache_get, cache_set
+from utils.request_context import get_request_user, set_request_user
+
+load_dotenv()
 
 # ===============================
 # Password Hashing
@@ -23,14 +32,19 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return password_hasher.verify(plain_password, hashed_password)
 
+# Verified against when the login email doesn't exist, so unknown and known
+# accounts both cost one KDF run and response time doesn't reveal which it was
+DUMMY_PASSWORD_HASH = hash_password("dummy-password-for-timing")
+
 
 # ===============================
 # JWT Config
 # ===============================
 
-SECRET_KEY = "CHANGE_ME_TO_A_LONG_RANDOM_SECRET"
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
+# Set JWT_SECRET_KEY in production; the fallback is for local development only
+SECRET_KEY = os.getenv("JWT_SECRET_KEY", "CHANGE_ME_TO_A_LONG_RANDOM_SECRET")
+ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
@@ -61,6 +75,20 @@ def create_access_token(
 # ===============================
 
 def decode_access_token(token: str) -> Optional[TokenData]:
+    token_data = _decode_token(token)
+
+    # Cached results can outlive the token itself: re-check expiry on every call
+    if token_data is None or (
+        token_data.exp is not None and token_data.exp <= time.time()
+    ):
+        return None
+
+    return token_data
+
+
+# Same token arrives on every request of a session; verify its signature once
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> Optional[TokenData]:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
@@ -72,7 +100,8 @@ def decode_access_token(token: str) -> Optional[TokenData]:
 
         return TokenData(
             user_id=int(user_id),
-            email=email
+            email=email,
+            exp=payload.get("exp"),
         )
 
     except JWTError:
@@ -83,10 +112,51 @@ def decode_access_token(token: str) -> Optional[TokenData]:
 # AUTHENTICATION
 # ===============================
 
+# Resolved users are cached per process (USER_LOCAL_CACHE_TTL) and in Redis
+# (USER_CACHE_TTL) as UserRead, keyed by email. These bound how long a
+# role/account change can go unnoticed; call invalidate_user_cache() after
+# writing a user.
+USER_CACHE_TTL = 300       # seconds
+USER_LOCAL_CACHE_TTL = 60  # seconds
+
+_local_user_cache = TTLCache(maxsize=10_000, ttl=USER_LOCAL_CACHE_TTL)
+
+
+def _user_cache_key(email: str) -> str:
+    return f"user:{email}"
+
+
+def invalidate_user_cache(email: str) -> None:
+    _local_user_cache.pop(email)
+    cache_delete(_user_cache_key(email))
+
+
+def get_cached_user(email: str) -> Optional[UserRead]:
+    # 1) process-local, 2) Redis; the caller falls back to the DB
+    user_read = _local_user_cache.get(email)
+    if user_read is None:
+        cached = cache_get(_user_cache_key(email))
+        if cached is not None:
+            user_read = UserRead.model_validate_json(cached)
+            _local_user_cache.set(email, user_read)
+    return user_read
+
+
+def cache_user(user_read: UserRead) -> None:
+    cache_set(_user_cache_key(user_read.email), user_read.model_dump_json(), USER_CACHE_TTL)
+    _local_user_cache.set(user_read.email, user_read)
+
+
 def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
-):
+) -> UserRead:
+    # Resolved once per request, whichever auth dependency got there first
+    user_read = get_request_user(request)
+    if user_read is not None:
+        return user_read
+
     token_data = decode_access_token(token)
 
     if not token_data:
@@ -96,16 +166,29 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    user = db.query(User).filter(User.id == token_data.user_id).first()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"}
+    user_read = get_cached_user(token_data.email)
+    if user_read is None:
+        # Primary-key lookup of just the columns UserRead reads
+        user = (
+            db.query(User)
+            .options(load_only(User.id, User.email, User.role, User.is_active, User.address))
+            .filter(User.id == token_data.user_id)
+            .first()
         )
 
-    return user
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+
+        # Validated while the session is open; only the UserRead is cached
+        user_read = UserRead.model_validate(user)
+        cache_user(user_read)
+
+    set_request_user(request, user_read)
+    return user_read
 
 
 # ===============================
@@ -113,7 +196,7 @@ def get_current_user(
 # ===============================
 
 def admin_required(
-    user: User = Depends(get_current_user)
+    user: UserRead = Depends(get_current_user)
 ):
     if not getattr(user, "is_admin", False):
         raise HTTPException(
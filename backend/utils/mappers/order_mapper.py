@@ -1,11 +1,11 @@
 # utils/mappers/order_mapper.py
 
-def map_order_list(orders):
+def map_order_list(orders, summary):
     return {
         "summary": {
-            "total_orders": len(orders),
-            "pending_orders": sum(1 for o in orders if o.status == "PENDING"),
-            "total_amount": round(sum(o.grand_total for o in orders), 2),
+            "total_orders": summary.total_orders,
+            "pending_orders": summary.pending_orders,
+            "total_amount": round(summary.total_amount, 2),
         },
         "orders": [
             {
@@ -39,7 +39,7 @@ def map_order_detail(order):
         "items": [
             {
                 "product_id": item.product_id,
-                "product_name": item.product.name,
+                "product_name": item.product_name,
                 "unit_price": float(item.unit_price),
                 "quantity": item.quantity,
                 "total_price": float(item.total_price),
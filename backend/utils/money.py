@@ -0,0 +1,17 @@
+# utils/money.py
+
+from decimal import Decimal, ROUND_HALF_UP
+
+# Money is stored as Numeric(10, 2) rupees. Pricing math runs on integer
+# paise instead: exact, no quantize bookkeeping, and much cheaper than
+# Decimal arithmetic. Convert at the edges with these two helpers.
+
+
+def to_paise(amount: Decimal) -> int:
+    """Rupees -> integer paise (half-up if more than 2 decimal places)."""
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_paise(paise: int) -> Decimal:
+    """Integer paise -> rupees as a 2-place Decimal."""
+    return Decimal(paise).scaleb(-2)
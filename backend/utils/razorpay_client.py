@@ -1,6 +1,34 @@
 # Utils/razorpay_client.py
 
+import hashlib
+import hmac
+
 import razorpay
+import requests
+from requests.adapters import HTTPAdapter
+
 from utils.payment_config import RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET
 
-razorpay_client = razorpay.Client(auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET))
+# Payment handlers run concurrently in the threadpool; size the keep-alive
+# pool for that so Razorpay calls reuse warm TLS connections instead of
+# discarding them once the default 10-connection pool is full.
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=50))
+
+razorpay_client = razorpay.Client(
+    session=_http_session,
+    auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET),
+)
+
+
+# Checkout signature = HMAC-SHA256(key_secret, "<order_id>|<payment_id>").
+# Same check as razorpay_client.utility.verify_payment_signature, done
+# locally: the keyed HMAC state is built once and copied per call.
+_signature_hmac = hmac.new(RAZORPAY_KEY_SECRET.encode(), digestmod=hashlib.sha256)
+
+
+def verify_payment_signature(order_id: str, payment_id: str, signature: str) -> bool:
+    mac = _signature_hmac.copy()
+    mac.update(f"{order_id}|{payment_id}".encode())
+    # bytes on both sides: compare_digest rejects non-ASCII str input
+    return hmac.compare_digest(mac.hexdigest().encode(), signature.encode())
@@ -2,6 +2,12 @@
 
 from contextvars import ContextVar
 
+from fastapi import Request
+
+from schemas.user_schema import UserRead
+
+# Only the logging filter reads this: log calls deep in services/repos
+# have no Request to look at. Everything else uses request.state.user.
 _current_user = ContextVar("current_user", default=None)
 
 
@@ -11,3 +17,17 @@ def set_current_user(user):
 
 def get_current_user():
     return _current_user.get()
+
+
+def get_request_user(request: Request):
+    """UserRead resolved for this request by the auth dependency, or None."""
+    user = getattr(request.state, "user", None)
+    # Only ever hand back what get_current_user stored, never some other object
+    return user if isinstance(user, UserRead) else None
+
+
+def set_request_user(request: Request, user: UserRead) -> None:
+    # request.state is the source of truth for the rest of the request;
+    # the contextvar only feeds the "user=" field of log records.
+    request.state.user = user
+    set_current_user(user)
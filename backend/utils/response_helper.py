@@ -1,21 +1,52 @@
+from decimal import Decimal
 from typing import Any
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+
+import orjson
+from fastapi.encoders import decimal_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(obj: Any) -> Any:
+    # Only called for types orjson can't serialize natively;
+    # encoded the same way jsonable_encoder does.
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return decimal_encoder(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class APIResponse(ORJSONResponse):
+    """Single C-level orjson pass; accepts pydantic models and Decimals as-is."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
 
 
 def success_response(
     message: str,
     data: Any = None,
-    status_code: int = 200
+    status_code: int = 200,
+    meta: dict | None = None
 ):
-    return JSONResponse(
+    content = {
+        "status_code": status_code,
+        "message": message,
+        "data": data,
+        "error": None
+    }
+    # Optional pagination metadata, e.g. {"next_cursor": 42}
+    if meta is not None:
+        content["meta"] = meta
+
+    return APIResponse(
         status_code=status_code,
-        content=jsonable_encoder({
-            "status_code": status_code,
-            "message": message,
-            "data": data,
-            "error": None
-        })
+        content=content
     )
 
 
@@ -24,12 +55,12 @@ def error_response(
     status_code: int = 400,
     error: str | None = None
 ):
-    return JSONResponse(
+    return APIResponse(
         status_code=status_code,
-        content=jsonable_encoder({
+        content={
             "status_code": status_code,
             "message": message,
             "data": None,
             "error": error or message
-        })
+        }
     )